@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+#
+# Author:   Daniela Ďuričeková, daniela.duricekova@protonmail.com
+# Date:     2026-10-19
+#
+
+"""Script that compares the speed of the available engines."""
+
+import argparse
+import time
+
+from life.game import ENGINES
+from life.game import Game
+from life.lattice import Lattice
+
+
+def measure_step_time(lattice, engine, num_of_steps):
+    game = Game.from_lattice(lattice, engine)
+    # The first step is not measured so that one-time setup costs (such as
+    # precomputing lookup tables) do not skew the results.
+    game.make_step()
+    start = time.perf_counter()
+    for _ in range(num_of_steps):
+        game.make_step()
+    return (time.perf_counter() - start) / num_of_steps, game
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('sizes', metavar='SIZE', type=int, nargs='*',
+        default=[64, 128, 256])
+    parser.add_argument('--steps', type=int, default=5)
+    parser.add_argument('--density', type=float, default=0.3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--pattern', type=argparse.FileType(),
+        help='stamp the pattern from the given file instead of random cells')
+    parser.add_argument('--spacing', type=int,
+        help='distance between stamped patterns (default: pattern size + 1)')
+    args = parser.parse_args()
+    pattern = None
+    if args.pattern is not None:
+        pattern = Lattice.from_string(args.pattern.read())
+        if args.spacing is None:
+            args.spacing = pattern.size + 1
+        elif args.spacing < pattern.size:
+            parser.error('spacing must be at least the pattern size ({})'
+                .format(pattern.size))
+
+    print('{:>6} {}'.format('size', ' '.join(
+        '{:>12}'.format(engine) for engine in ENGINES)))
+    for size in args.sizes:
+        if pattern is not None:
+            lattice = Lattice.tiled(size, pattern, args.spacing)
+        else:
+            lattice = Lattice.random(size, args.density, args.seed)
+        results = [measure_step_time(lattice, engine, args.steps)
+            for engine in ENGINES]
+        if any(game != results[0][1] for _, game in results):
+            raise SystemExit('Engines disagree on size {}.'.format(size))
+        print('{:>6} {}'.format(size, ' '.join(
+            '{:>10.2f}ms'.format(step_time * 1000)
+            for step_time, _ in results)))
+
+if __name__ == '__main__':
+    main()
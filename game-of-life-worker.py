@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+#
+# Author:   Daniela Ďuričeková, daniela.duricekova@protonmail.com
+# Date:     2026-10-19
+#
+
+"""Script that serves one strip of a distributed game."""
+
+import os
+import sys
+
+from life.distributed import run_worker
+
+
+def parse_address(address):
+    host, sep, port = address.rpartition(':')
+    if sep and port.isdigit():
+        return (host, int(port))
+    return address
+
+
+def main():
+    usage = 'usage: LIFE_AUTHKEY=KEY {} HOST:PORT|SOCKET_PATH'.format(
+        sys.argv[0])
+    if len(sys.argv) != 2:
+        sys.exit(usage)
+    # Workers unpickle what they receive, so they must never run without a
+    # key that the coordinator has to prove it knows.
+    authkey = os.environ.get('LIFE_AUTHKEY')
+    if not authkey:
+        sys.exit(usage)
+    run_worker(parse_address(sys.argv[1]), authkey.encode())
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+#
+# Author:   Daniela Ďuričeková, daniela.duricekova@protonmail.com
+# Date:     2026-10-19
+#
+
+"""Table-driven engine that computes a step in blocks of 2x2 cells.
+
+The next state of a 2x2 block depends only on the 4x4 neighbourhood around
+it. Encoded as a 16-bit number (bit 4 * row + col is the cell in the given
+row and column), every such neighbourhood is an index into a table of 65536
+precomputed 4-bit results (bit 2 * row + col is the cell in the given row
+and column of the block).
+"""
+
+from life.lattice import Lattice
+
+
+_table = None
+
+# Translation tables between cells (0 or 1 bytes) and binary digits.
+_CELLS_TO_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+_DIGITS_TO_CELLS = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def make_step(lattice):
+    """Returns a new lattice with the next generation of the given lattice."""
+    return Lattice._from_rows(make_strip_step(lattice._lattice))
+
+
+def make_strip_step(rows, upper_halo=None, lower_halo=None):
+    """Returns the next generation of a horizontal strip of rows.
+
+    The halos are the rows directly above and below the strip (None when the
+    strip touches the edge of the lattice, beyond which all cells are dead).
+    """
+    table = _get_table()
+    width = len(rows[0])
+    num_of_row_blocks = (len(rows) + 1) // 2
+    num_of_col_blocks = (width + 1) // 2
+    # Bit y + 1 of a row mask is cell y, so the neighbourhood of block column
+    # j (cells 2j - 1 to 2j + 2) starts at bit 2j. Columns outside the
+    # lattice are dead.
+    row_masks = ([_halo_to_mask(upper_halo)] +
+        [_row_to_mask(row) for row in rows] + [_halo_to_mask(lower_halo)])
+    if len(rows) % 2 == 1:
+        # The bottom half of the last block lies below the strip; its result
+        # is dropped, but its neighbourhood still needs one more row.
+        row_masks.append(0)
+    new_rows = []
+    for i in range(num_of_row_blocks):
+        r0, r1, r2, r3 = row_masks[2 * i:2 * i + 4]
+        top_mask = bottom_mask = 0
+        for j in range(num_of_col_blocks):
+            shift = 2 * j
+            block = table[((r0 >> shift) & 15) |
+                          ((r1 >> shift) & 15) << 4 |
+                          ((r2 >> shift) & 15) << 8 |
+                          ((r3 >> shift) & 15) << 12]
+            top_mask |= (block & 3) << shift
+            bottom_mask |= (block >> 2) << shift
+        new_rows.append(_mask_to_row(top_mask, width))
+        new_rows.append(_mask_to_row(bottom_mask, width))
+    return new_rows[:len(rows)]
+
+
+def _get_table():
+    global _table
+    if _table is None:
+        _table = _compute_table()
+    return _table
+
+
+def _compute_table():
+    # Each of the four cells of the block is described by the position of its
+    # bit and by the mask of its eight neighbours in the neighbourhood.
+    cells = []
+    for row in (1, 2):
+        for col in (1, 2):
+            neighbours_mask = 0
+            for x in (row - 1, row, row + 1):
+                for y in (col - 1, col, col + 1):
+                    if (x, y) != (row, col):
+                        neighbours_mask |= 1 << (4 * x + y)
+            cells.append((4 * row + col, neighbours_mask))
+
+    table = bytearray(1 << 16)
+    for neighbourhood in range(1 << 16):
+        block = 0
+        for i, (bit, neighbours_mask) in enumerate(cells):
+            num_of_live_neighbours = bin(
+                neighbourhood & neighbours_mask).count('1')
+            is_live = (neighbourhood >> bit) & 1
+            if (num_of_live_neighbours == 3 or
+                    (is_live and num_of_live_neighbours == 2)):
+                block |= 1 << i
+        table[neighbourhood] = block
+    return table
+
+
+def _halo_to_mask(halo):
+    return _row_to_mask(halo) if halo is not None else 0
+
+
+def _row_to_mask(row):
+    return int(row[::-1].translate(_CELLS_TO_DIGITS), 2) << 1
+
+
+def _mask_to_row(mask, size):
+    digits = format(mask & ((1 << size) - 1), '0{}b'.format(size))
+    return bytearray(digits[::-1], 'ascii').translate(_DIGITS_TO_CELLS)
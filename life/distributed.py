@@ -0,0 +1,462 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+#
+# Author:   Daniela Ďuričeková, daniela.duricekova@protonmail.com
+# Date:     2026-10-19
+#
+
+"""Distributed simulation of a lattice over sockets.
+
+The lattice is split into horizontal strips of rows. Every strip is owned by
+a worker process listening on a TCP or Unix socket. Before each generation,
+neighbouring workers exchange the rows on the border of their strips (halos),
+so the coordinator only has to broadcast commands and gather results. The
+coordinator never needs to hold the whole lattice: workers can create their
+strips themselves (seed_random()) and rows can be streamed in and out in
+ranges (set_rows(), get_rows()).
+"""
+
+import collections.abc
+import itertools
+import multiprocessing
+import os
+import random
+import shutil
+import socket
+import tempfile
+import time
+from multiprocessing.connection import Client
+from multiprocessing.connection import Listener
+
+from life import block_engine
+from life.lattice import InvalidSizeError
+from life.lattice import Lattice
+from life.lattice import OutOfBoundsError
+
+
+# Maximal number of rows sent to a worker in a single message.
+_CHUNK_SIZE = 64
+
+
+class DistributedError(Exception):
+    pass
+
+
+class InvalidNumOfWorkersError(DistributedError):
+    def __init__(self, num_of_workers, size):
+        msg = "Cannot split lattice of size {} among {} workers.".format(
+            size, num_of_workers)
+        super().__init__(msg)
+
+
+class InvalidFamilyError(DistributedError):
+    def __init__(self, family):
+        msg = ("Invalid address family '{}' "
+            "(expected AF_UNIX or AF_INET).".format(family))
+        super().__init__(msg)
+
+
+class InvalidCellError(DistributedError):
+    def __init__(self, x, y, value):
+        msg = "Invalid cell value {} on position ({}, {}).".format(value, x, y)
+        super().__init__(msg)
+
+
+class MissingAuthkeyError(DistributedError):
+    def __init__(self, address):
+        msg = "TCP address {} requires an authentication key.".format(address)
+        super().__init__(msg)
+
+
+class WorkerError(DistributedError):
+    pass
+
+
+def run_worker(address, authkey=None):
+    """Serves one strip of a distributed lattice until told to close."""
+    # Received messages are unpickled, so nobody who can reach a TCP port may
+    # be allowed to talk to the worker without knowing the key.
+    _validate_authkey(address, authkey)
+    # The coordinator connects first, the worker owning the following strip
+    # second.
+    with Listener(address, backlog=2, authkey=authkey) as listener:
+        with listener.accept() as coordinator:
+            _Worker(listener, coordinator, authkey).serve()
+
+
+class DistributedGame:
+    def __init__(self, size, addresses, authkey=None, timeout=60,
+            step_timeout=None):
+        """Connects to workers and gives each of them a strip of dead cells.
+
+        The timeout (in seconds) applies to connecting to the workers and to
+        waiting for replies that involve no computation. Replies to
+        make_step() and seed_random(), whose duration grows with the size of
+        the strips, are awaited for step_timeout seconds (None means without
+        limit). Once a worker does not reply in time or its connection is
+        lost, all connections are closed and the game can only be closed.
+        """
+        self._validate_num_of_workers(len(addresses), size)
+        for address in addresses:
+            _validate_authkey(address, authkey)
+        self._size = size
+        self._timeout = timeout
+        self._step_timeout = step_timeout
+        self._processes = []
+        self._tmp_dir = None
+        self._has_failed = False
+        self._strips = _split_into_strips(size, len(addresses))
+        self._workers = []
+        try:
+            for address in addresses:
+                self._workers.append(_connect(address, authkey, timeout))
+            for i, (start, end) in enumerate(self._strips):
+                upper_address = addresses[i - 1] if i > 0 else None
+                has_lower = i < len(addresses) - 1
+                self._send(self._workers[i], ('setup', size, start, end,
+                    upper_address, has_lower, i % 2 == 0))
+            self._receive_from_all(self._timeout)
+        except Exception:
+            self._close_connections()
+            raise
+
+    @staticmethod
+    def spawn_local(size, num_of_workers, family='AF_UNIX', timeout=60,
+            step_timeout=None):
+        """Starts local worker processes and connects to them."""
+        DistributedGame._validate_num_of_workers(num_of_workers, size)
+        authkey = os.urandom(16)
+        tmp_dir = None
+        if family == 'AF_UNIX':
+            tmp_dir = tempfile.mkdtemp(prefix='life-')
+            addresses = [os.path.join(tmp_dir, 'worker-{}.sock'.format(i))
+                for i in range(num_of_workers)]
+        elif family == 'AF_INET':
+            addresses = [('127.0.0.1', _find_free_port())
+                for _ in range(num_of_workers)]
+        else:
+            raise InvalidFamilyError(family)
+        processes = [multiprocessing.Process(target=run_worker,
+            args=(address, authkey), daemon=True) for address in addresses]
+        for process in processes:
+            process.start()
+        try:
+            game = DistributedGame(size, addresses, authkey, timeout,
+                step_timeout)
+        except Exception:
+            _terminate(processes)
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        game._processes = processes
+        game._tmp_dir = tmp_dir
+        return game
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def num_of_workers(self):
+        return len(self._strips)
+
+    def set_lattice(self, lattice):
+        if lattice.size != self.size:
+            raise InvalidSizeError(lattice.size)
+        self.set_rows(0, lattice._lattice)
+
+    def set_rows(self, start, rows):
+        """Replaces rows from start on with the given rows.
+
+        The rows may be any iterable of sequences with one item (0 or 1) per
+        cell. When they form a sequence (such as a list), all of them are
+        validated before any of them is sent. Other iterables (such as
+        generators) are validated and sent in chunks, so the rows never have
+        to be in memory all at once, but an invalid row leaves the rows
+        before its chunk already replaced.
+        """
+        self._validate_row_range(start, self.size)
+        if isinstance(rows, collections.abc.Sequence):
+            self._validate_row_range(start, start + len(rows))
+            for x, row in enumerate(rows, start):
+                self._validate_row(x, bytes(row))
+        rows = iter(rows)
+        x = start
+        for worker, (strip_start, strip_end) in zip(self._workers,
+                self._strips):
+            while strip_start <= x < strip_end:
+                chunk = [bytes(row) for row in itertools.islice(
+                    rows, min(_CHUNK_SIZE, strip_end - x))]
+                if not chunk:
+                    return
+                for i, row in enumerate(chunk):
+                    self._validate_row(x + i, row)
+                self._request(worker, ('set_rows', x - strip_start, chunk),
+                    self._timeout)
+                x += len(chunk)
+        if next(rows, None) is not None:
+            raise OutOfBoundsError(x, 0)
+
+    def seed_random(self, density=0.5, seed=None):
+        """Makes the lattice equal to Lattice.random(size, density, seed).
+
+        Every worker creates its own strip, so no rows are transferred.
+        """
+        Lattice._validate_density(density)
+        if seed is None:
+            seed = random.getrandbits(64)
+        self._send_to_all(('seed_random', density, seed))
+        self._receive_from_all(self._step_timeout)
+
+    def make_step(self):
+        self._send_to_all(('step',))
+        self._receive_from_all(self._step_timeout)
+
+    def get_population(self):
+        self._send_to_all(('population',))
+        return sum(self._receive_from_all(self._timeout))
+
+    def get_rows(self, start=0, end=None):
+        """Returns rows from start to end - 1 as bytearrays.
+
+        Only the workers owning the requested rows are asked for them.
+        """
+        if end is None:
+            end = self.size
+        self._validate_row_range(start, end)
+        rows = []
+        for worker, (strip_start, strip_end) in zip(self._workers,
+                self._strips):
+            if start < strip_end and strip_start < end:
+                rows.extend(bytearray(row) for row in self._request(worker,
+                    ('rows', max(start, strip_start) - strip_start,
+                        min(end, strip_end) - strip_start), self._timeout))
+        return rows
+
+    def get_snapshot(self):
+        return Lattice._from_rows(self.get_rows())
+
+    def close(self):
+        for worker in self._workers:
+            try:
+                worker.send(('close',))
+            except OSError:
+                pass
+        self._close_connections()
+        for process in self._processes:
+            process.join(self._timeout)
+        _terminate([process for process in self._processes
+            if process.is_alive()])
+        self._processes = []
+        if self._tmp_dir is not None:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+            self._tmp_dir = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return repr(self.get_snapshot())
+
+    def _request(self, worker, command, timeout):
+        self._validate_usability()
+        self._send(worker, command)
+        return self._receive(worker, timeout)
+
+    def _send_to_all(self, command):
+        self._validate_usability()
+        for worker in self._workers:
+            self._send(worker, command)
+
+    def _receive_from_all(self, timeout):
+        return [self._receive(worker, timeout) for worker in self._workers]
+
+    def _send(self, worker, command):
+        try:
+            worker.send(command)
+        except OSError as e:
+            self._fail()
+            raise WorkerError('Lost connection to a worker.') from e
+
+    def _receive(self, worker, timeout):
+        try:
+            if not worker.poll(timeout):
+                raise WorkerError(
+                    'Worker did not reply within {} s.'.format(timeout))
+            return worker.recv()
+        except (EOFError, OSError) as e:
+            self._fail()
+            raise WorkerError('Lost connection to a worker.') from e
+        except WorkerError:
+            self._fail()
+            raise
+
+    def _fail(self):
+        # Replies that have not been read would be taken for replies to the
+        # following commands, so no further commands may be sent.
+        self._has_failed = True
+        self._close_connections()
+
+    def _close_connections(self):
+        for worker in self._workers:
+            worker.close()
+        self._workers = []
+
+    def _validate_usability(self):
+        if self._has_failed:
+            raise WorkerError('Game cannot be used after a worker failure.')
+        if not self._workers:
+            raise WorkerError('Game has been closed.')
+
+    def _validate_row(self, x, row):
+        if len(row) != self.size:
+            raise InvalidSizeError(len(row))
+        invalid_values = row.translate(None, b'\x00\x01')
+        if invalid_values:
+            value = invalid_values[0]
+            raise InvalidCellError(x, row.index(value), value)
+
+    def _validate_row_range(self, start, end):
+        if not (0 <= start <= end <= self.size):
+            raise OutOfBoundsError(start, end)
+
+    @staticmethod
+    def _validate_num_of_workers(num_of_workers, size):
+        if not (0 < num_of_workers <= size):
+            raise InvalidNumOfWorkersError(num_of_workers, size)
+
+
+class _Worker:
+    def __init__(self, listener, coordinator, authkey):
+        self._listener = listener
+        self._coordinator = coordinator
+        self._authkey = authkey
+        self._size = 0
+        # Index of the first row of the strip in the whole lattice.
+        self._start = 0
+        # Every row is stored as a bytearray with one byte (0 or 1) per cell.
+        self._rows = []
+        # Connections to the workers owning the preceding and the following
+        # strip (None on the border of the lattice).
+        self._upper = None
+        self._lower = None
+        # Whether the worker sends its halos before receiving those of its
+        # neighbours (true for strips with an even index).
+        self._sends_first = True
+
+    def serve(self):
+        try:
+            while True:
+                try:
+                    command, *args = self._coordinator.recv()
+                except EOFError:
+                    # The coordinator has gone away (e.g. after a failure).
+                    break
+                if command == 'close':
+                    break
+                handler = getattr(self, '_handle_' + command)
+                self._coordinator.send(handler(*args))
+        finally:
+            for neighbour in (self._upper, self._lower):
+                if neighbour is not None:
+                    neighbour.close()
+
+    def _handle_setup(self, size, start, end, upper_address, has_lower,
+            sends_first):
+        self._size = size
+        self._start = start
+        self._sends_first = sends_first
+        self._rows = [bytearray(size) for _ in range(start, end)]
+        # Workers connect to their upper neighbour before accepting the lower
+        # one, so the connections are established from the top strip down.
+        if upper_address is not None:
+            self._upper = Client(upper_address, authkey=self._authkey)
+        if has_lower:
+            self._lower = self._listener.accept()
+
+    def _handle_set_rows(self, start, rows):
+        self._rows[start:start + len(rows)] = [bytearray(row) for row in rows]
+
+    def _handle_seed_random(self, density, seed):
+        self._rows = Lattice._create_random_rows(self._size, density, seed,
+            self._start, self._start + len(self._rows))
+
+    def _handle_step(self):
+        upper_halo, lower_halo = self._exchange_halos()
+        self._rows = block_engine.make_strip_step(self._rows, upper_halo,
+            lower_halo)
+
+    def _handle_population(self):
+        return sum(row.count(1) for row in self._rows)
+
+    def _handle_rows(self, start, end):
+        return [bytes(row) for row in self._rows[start:end]]
+
+    def _exchange_halos(self):
+        # Workers of even strips send first and workers of odd strips receive
+        # first, so all links exchange their halos at the same time. No two
+        # workers ever block sending to each other.
+        if self._sends_first:
+            self._send_halos()
+            return self._receive_halos()
+        halos = self._receive_halos()
+        self._send_halos()
+        return halos
+
+    def _send_halos(self):
+        if self._upper is not None:
+            self._upper.send_bytes(self._rows[0])
+        if self._lower is not None:
+            self._lower.send_bytes(self._rows[-1])
+
+    def _receive_halos(self):
+        upper_halo = lower_halo = None
+        if self._upper is not None:
+            upper_halo = self._upper.recv_bytes()
+        if self._lower is not None:
+            lower_halo = self._lower.recv_bytes()
+        return upper_halo, lower_halo
+
+
+def _split_into_strips(size, num_of_workers):
+    strip_size, remainder = divmod(size, num_of_workers)
+    strips = []
+    start = 0
+    for i in range(num_of_workers):
+        end = start + strip_size + (1 if i < remainder else 0)
+        strips.append((start, end))
+        start = end
+    return strips
+
+
+def _validate_authkey(address, authkey):
+    if authkey is None and isinstance(address, tuple):
+        raise MissingAuthkeyError(address)
+
+
+def _connect(address, authkey, timeout):
+    # Workers may still be starting, so retry until their listeners are up.
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return Client(address, authkey=authkey)
+        except (FileNotFoundError, ConnectionRefusedError):
+            if time.monotonic() > deadline:
+                raise WorkerError(
+                    'Cannot connect to worker at {}.'.format(address))
+            time.sleep(0.01)
+
+
+def _find_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _terminate(processes):
+    for process in processes:
+        process.terminate()
+        process.join()
@@ -5,19 +5,40 @@
 # Date:     2014-07-08
 #
 
-"""Representation of a lattice."""
+"""Representation of a game that steps its lattice by using an engine."""
 
+from life import block_engine
 from life.lattice import Lattice
 
 
+ENGINES = ('cell', 'block')
+
+
+class GameError(Exception):
+    pass
+
+
+class InvalidEngineError(GameError):
+    def __init__(self, engine):
+        msg = "Invalid engine '{}' (expected one of: {}).".format(
+            engine, ', '.join(ENGINES))
+        super().__init__(msg)
+
+
 class Game:
-    def __init__(self, size):
+    def __init__(self, size, engine='cell'):
+        self._validate_engine(engine)
+        self._engine = engine
         self._lattice = Lattice(size)
 
     @staticmethod
-    def from_string(str, dead_symbol=' ', live_symbol='x'):
+    def from_string(str, dead_symbol=' ', live_symbol='x', engine='cell'):
         lattice = Lattice.from_string(str, dead_symbol, live_symbol)
-        game = Game(lattice.size)
+        return Game.from_lattice(lattice, engine)
+
+    @staticmethod
+    def from_lattice(lattice, engine='cell'):
+        game = Game(lattice.size, engine)
         game._lattice = lattice
         return game
 
@@ -25,7 +46,17 @@ class Game:
     def size(self):
         return self._lattice.size
 
+    @property
+    def engine(self):
+        return self._engine
+
     def make_step(self):
+        if self._engine == 'block':
+            self._lattice = block_engine.make_step(self._lattice)
+        else:
+            self._make_cell_step()
+
+    def _make_cell_step(self):
         new_lattice = Lattice(self.size)
         for x in range(self.size):
             for y in range(self.size):
@@ -47,6 +78,10 @@ class Game:
 
         return False
 
+    def _validate_engine(self, engine):
+        if engine not in ENGINES:
+            raise InvalidEngineError(engine)
+
     def __eq__(self, other):
         return self._lattice == other._lattice
 
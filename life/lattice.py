@@ -7,6 +7,9 @@
 
 """Representation of a lattice."""
 
+import random as _random
+
+
 class LatticeError(Exception):
     pass
 
@@ -25,11 +28,20 @@ class InvalidSizeError(LatticeError):
     pass
 
 
+class InvalidDensityError(LatticeError):
+    pass
+
+
+class InvalidSpacingError(LatticeError):
+    pass
+
+
 class Lattice:
     def __init__(self, size):
         self._validate_size(size)
         self._size = size
-        self._lattice = [[False for _ in range(size)] for _ in range(size)]
+        # Every row is stored as a bytearray with one byte (0 or 1) per cell.
+        self._lattice = [bytearray(size) for _ in range(size)]
 
     @staticmethod
     def from_string(str, dead_symbol=' ', live_symbol='x'):
@@ -42,6 +54,41 @@ class Lattice:
         return Lattice._create_lattice_from_str_lattice(
             str_lattice, dead_symbol, live_symbol)
 
+    @staticmethod
+    def random(size, density=0.5, seed=None):
+        """Creates a lattice whose cells are live with the given probability.
+
+        The density is rounded to the nearest multiple of 1/2**32. Lattices
+        created with the same seed are identical. Every row is created from
+        its own generator derived from the seed and the row index, so any
+        range of rows can be recreated without the rest of the lattice.
+        """
+        Lattice._validate_size(size)
+        Lattice._validate_density(density)
+        if seed is None:
+            seed = _random.getrandbits(64)
+        return Lattice._from_rows(
+            Lattice._create_random_rows(size, density, seed, 0, size))
+
+    @staticmethod
+    def tiled(size, pattern, spacing):
+        """Creates a lattice with the pattern stamped every spacing cells.
+
+        Copies of the pattern start at every position whose coordinates are
+        multiples of spacing and are clipped at the edges of the lattice.
+        """
+        Lattice._validate_size(size)
+        Lattice._validate_spacing(spacing, pattern.size)
+        num_of_tiles = size // spacing + 1
+        row_templates = []
+        for x in range(spacing):
+            pattern_row = (pattern._lattice[x] if x < pattern.size
+                else bytearray(pattern.size))
+            tile_row = pattern_row + bytearray(spacing - pattern.size)
+            row_templates.append((tile_row * num_of_tiles)[:size])
+        return Lattice._from_rows(
+            [bytearray(row_templates[x % spacing]) for x in range(size)])
+
     @property
     def size(self):
         return self._size
@@ -110,13 +157,57 @@ class Lattice:
         if not self._is_valid_position(x, y):
             raise OutOfBoundsError(x, y)
 
-    def _validate_size(self, size):
+    @staticmethod
+    def _validate_size(size):
         if size <= 0:
             raise InvalidSizeError(size)
 
+    @staticmethod
+    def _validate_density(density):
+        if not (0 <= density <= 1):
+            raise InvalidDensityError(density)
+
+    @staticmethod
+    def _validate_spacing(spacing, pattern_size):
+        if spacing < pattern_size:
+            raise InvalidSpacingError(spacing)
+
     def _is_valid_position(self, x, y):
         return (0 <= x < self.size) and (0 <= y < self.size)
 
+    @staticmethod
+    def _from_rows(rows):
+        lattice = Lattice.__new__(Lattice)
+        lattice._size = len(rows)
+        lattice._lattice = rows
+        return lattice
+
+    @staticmethod
+    def _create_random_rows(size, density, seed, start, end):
+        # A cell is live when its 32-bit random sample is below the threshold.
+        # The high byte of the sample decides most cells at once; the low 24
+        # bits are drawn only for cells whose high byte equals the high byte
+        # of the threshold.
+        high_threshold, low_threshold = divmod(round(density * 2 ** 32),
+            2 ** 24)
+        high_table = bytes(1 if byte < high_threshold else 0
+            for byte in range(256))
+        rows = []
+        for x in range(start, end):
+            # Every row has its own generator, so any range of rows can be
+            # created without creating the rows before it.
+            rng = _random.Random('{}:{}'.format(seed, x))
+            high_bytes = rng.randbytes(size)
+            row = bytearray(high_bytes).translate(high_table)
+            if low_threshold > 0:
+                y = high_bytes.find(high_threshold)
+                while y != -1:
+                    if rng.getrandbits(24) < low_threshold:
+                        row[y] = 1
+                    y = high_bytes.find(high_threshold, y + 1)
+            rows.append(row)
+        return rows
+
     @staticmethod
     def _input_str_to_str_lattice(str):
         if str and str[-1] == '\n':
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+#
+# Author:   Daniela Ďuričeková, daniela.duricekova@protonmail.com
+# Date:     2026-10-19
+#
+
+"""Tests for the block_engine module."""
+
+import random
+import unittest
+
+from life import block_engine
+from life.game import Game
+from life.lattice import Lattice
+
+
+class BlockEngineMakeStepTests(unittest.TestCase):
+    def scenario_matches_cell_engine(self, size, num_of_steps=4):
+        rng = random.Random(size)
+        lattice = Lattice(size)
+        for x in range(size):
+            for y in range(size):
+                if rng.random() < 0.4:
+                    lattice.make_live(x, y)
+        game = Game.from_lattice(lattice)
+        for _ in range(num_of_steps):
+            game.make_step()
+            lattice = block_engine.make_step(lattice)
+            self.assertEqual(lattice, game._lattice,
+                "\nlattice:\n{}game:\n{}".format(lattice, game))
+
+    def test_single_cell_lattice_matches_cell_engine(self):
+        self.scenario_matches_cell_engine(1)
+
+    def test_even_sized_lattice_matches_cell_engine(self):
+        self.scenario_matches_cell_engine(16)
+
+    def test_odd_sized_lattice_matches_cell_engine(self):
+        self.scenario_matches_cell_engine(13)
+
+    def test_original_lattice_is_not_modified(self):
+        lattice = Lattice.from_string(
+            "   \n"
+            "xxx\n"
+            "   \n"
+        )
+        block_engine.make_step(lattice)
+        self.assertEqual(lattice, Lattice.from_string(
+            "   \n"
+            "xxx\n"
+            "   \n"
+        ))
+
+
+class BlockEngineTableTests(unittest.TestCase):
+    def test_table_covers_all_neighbourhoods(self):
+        self.assertEqual(len(block_engine._get_table()), 1 << 16)
+
+    def test_empty_neighbourhood_stays_empty(self):
+        self.assertEqual(block_engine._get_table()[0], 0)
+
+    def test_full_neighbourhood_dies_out(self):
+        self.assertEqual(block_engine._get_table()[0xffff], 0)
+
+    def test_block_is_still_life(self):
+        # Cells (1, 1), (1, 2), (2, 1), and (2, 2) are live.
+        self.assertEqual(block_engine._get_table()[0x0660], 0b1111)
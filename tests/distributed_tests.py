@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+#
+# Author:   Daniela Ďuričeková, daniela.duricekova@protonmail.com
+# Date:     2026-10-19
+#
+
+"""Tests for the distributed module."""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from multiprocessing.connection import Listener
+
+from life.distributed import DistributedGame
+from life.distributed import InvalidCellError
+from life.distributed import InvalidFamilyError
+from life.distributed import InvalidNumOfWorkersError
+from life.distributed import MissingAuthkeyError
+from life.distributed import WorkerError
+from life.distributed import run_worker
+from life.game import Game
+from life.lattice import InvalidSizeError
+from life.lattice import Lattice
+from life.lattice import OutOfBoundsError
+
+
+GLIDERS = (
+    "        \n"
+    " x    x \n"
+    "  x  x  \n"
+    "xxx  xxx\n"
+    "        \n"
+    "  xxx   \n"
+    "        \n"
+    "        \n"
+)
+
+
+class DistributedGameMakeStepTests(unittest.TestCase):
+    def scenario_matches_game(self, str, num_of_workers, num_of_steps=8,
+            family='AF_UNIX'):
+        lattice = Lattice.from_string(str)
+        game = Game.from_lattice(lattice)
+        with DistributedGame.spawn_local(lattice.size, num_of_workers,
+                family) as distributed_game:
+            distributed_game.set_lattice(lattice)
+            for _ in range(num_of_steps):
+                game.make_step()
+                distributed_game.make_step()
+                self.assertEqual(
+                    Game.from_lattice(distributed_game.get_snapshot()), game,
+                    "\ndistributed_game:\n{}game:\n{}".format(
+                    distributed_game, game))
+
+    def test_single_worker_matches_game(self):
+        self.scenario_matches_game(GLIDERS, 1)
+
+    def test_workers_with_uneven_strips_match_game(self):
+        self.scenario_matches_game(GLIDERS, 3)
+
+    def test_worker_per_row_matches_game(self):
+        self.scenario_matches_game(GLIDERS, 8)
+
+    def test_workers_over_tcp_match_game(self):
+        self.scenario_matches_game(GLIDERS, 2, family='AF_INET')
+
+
+class DistributedGameSetupTests(unittest.TestCase):
+    def test_all_cells_are_dead_after_creation(self):
+        with DistributedGame.spawn_local(5, 2) as distributed_game:
+            self.assertEqual(distributed_game.get_snapshot(), Lattice(5))
+
+    def test_seed_random_equals_random_lattice(self):
+        with DistributedGame.spawn_local(30, 4) as distributed_game:
+            distributed_game.seed_random(0.3, seed=7)
+            self.assertEqual(distributed_game.get_snapshot(),
+                Lattice.random(30, 0.3, seed=7))
+
+    def test_set_rows_streams_rows_from_iterable(self):
+        lattice = Lattice.from_string(GLIDERS)
+        with DistributedGame.spawn_local(8, 3) as distributed_game:
+            distributed_game.set_rows(2,
+                (lattice._lattice[x] for x in range(2, 7)))
+            self.assertEqual(distributed_game.get_rows(),
+                [bytearray(8)] * 2 + lattice._lattice[2:7] + [bytearray(8)])
+
+    def test_set_rows_fails_on_row_of_wrong_size(self):
+        with DistributedGame.spawn_local(3, 1) as distributed_game:
+            with self.assertRaises(InvalidSizeError):
+                distributed_game.set_rows(0, [b'\x01\x00'])
+
+    def test_set_rows_fails_on_cell_that_is_neither_live_nor_dead(self):
+        with DistributedGame.spawn_local(3, 1) as distributed_game:
+            with self.assertRaises(InvalidCellError) as cm:
+                distributed_game.set_rows(0, iter([b'\x01\x02\x00']))
+            self.assertRegex(str(cm.exception), r"^.*2.*0.*1.*$")
+
+    def test_set_rows_validates_all_rows_of_sequence_before_sending(self):
+        with DistributedGame.spawn_local(4, 2) as distributed_game:
+            with self.assertRaises(InvalidSizeError):
+                distributed_game.set_rows(0,
+                    [b'\x01' * 4, b'\x01' * 4, b'\x01' * 4, b'\x01'])
+            self.assertEqual(distributed_game.get_population(), 0)
+
+    def test_set_rows_fails_on_too_many_rows(self):
+        with DistributedGame.spawn_local(3, 2) as distributed_game:
+            with self.assertRaises(OutOfBoundsError):
+                distributed_game.set_rows(2, [bytes(3)] * 2)
+
+    def test_set_lattice_fails_on_lattice_of_different_size(self):
+        with DistributedGame.spawn_local(3, 1) as distributed_game:
+            with self.assertRaises(InvalidSizeError):
+                distributed_game.set_lattice(Lattice(4))
+
+
+class DistributedGameGatherTests(unittest.TestCase):
+    def setUp(self):
+        self.lattice = Lattice.from_string(GLIDERS)
+        self.distributed_game = DistributedGame.spawn_local(8, 3)
+        self.distributed_game.set_lattice(self.lattice)
+
+    def tearDown(self):
+        self.distributed_game.close()
+
+    def test_snapshot_equals_distributed_lattice(self):
+        self.assertEqual(self.distributed_game.get_snapshot(), self.lattice)
+
+    def test_get_rows_returns_range_spanning_several_workers(self):
+        self.assertEqual(self.distributed_game.get_rows(2, 6),
+            self.lattice._lattice[2:6])
+
+    def test_get_rows_returns_nothing_on_empty_range(self):
+        self.assertEqual(self.distributed_game.get_rows(4, 4), [])
+
+    def test_get_rows_fails_on_invalid_range(self):
+        with self.assertRaises(OutOfBoundsError):
+            self.distributed_game.get_rows(6, 9)
+
+    def test_population_is_number_of_live_cells(self):
+        self.assertEqual(self.distributed_game.get_population(), 13)
+
+    def test_size_is_size_of_lattice(self):
+        self.assertEqual(self.distributed_game.size, 8)
+        self.assertEqual(self.distributed_game.num_of_workers, 3)
+
+
+class DistributedGameInvalidArgumentsTests(unittest.TestCase):
+    def test_error_is_raised_on_zero_workers(self):
+        with self.assertRaises(InvalidNumOfWorkersError):
+            DistributedGame.spawn_local(3, 0)
+
+    def test_error_is_raised_on_more_workers_than_rows(self):
+        with self.assertRaises(InvalidNumOfWorkersError) as cm:
+            DistributedGame.spawn_local(3, 4)
+        self.assertRegex(str(cm.exception), r"^.*3.*4.*$")
+
+    def test_error_is_raised_on_unknown_family(self):
+        with self.assertRaises(InvalidFamilyError) as cm:
+            DistributedGame.spawn_local(3, 1, family='unix')
+        self.assertRegex(str(cm.exception), r"^.*unix.*$")
+
+    def test_game_requires_authkey_for_tcp_address(self):
+        with self.assertRaises(MissingAuthkeyError):
+            DistributedGame(3, [('127.0.0.1', 1)])
+
+    def test_worker_requires_authkey_for_tcp_address(self):
+        with self.assertRaises(MissingAuthkeyError):
+            run_worker(('127.0.0.1', 1))
+
+
+class DistributedGameTimeoutTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.address = os.path.join(self.tmp_dir, 'worker.sock')
+        self.authkey = b'key'
+        self.listener = Listener(self.address, authkey=self.authkey)
+        self.stop = threading.Event()
+        self.coordinator_has_disconnected = threading.Event()
+
+    def tearDown(self):
+        self.stop.set()
+        self.listener.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def start_stalled_worker(self, num_of_replies):
+        threading.Thread(target=self.serve_stalled_worker,
+            args=(num_of_replies,), daemon=True).start()
+
+    def serve_stalled_worker(self, num_of_replies):
+        # Replies to the given number of commands and then stops replying.
+        with self.listener.accept() as coordinator:
+            try:
+                for _ in range(num_of_replies):
+                    coordinator.recv()
+                    coordinator.send(None)
+                while not self.stop.is_set():
+                    if coordinator.poll(0.01):
+                        coordinator.recv()
+            except EOFError:
+                self.coordinator_has_disconnected.set()
+
+    def test_error_is_raised_when_worker_does_not_reply(self):
+        self.start_stalled_worker(0)
+        with self.assertRaises(WorkerError) as cm:
+            DistributedGame(3, [self.address], self.authkey, timeout=0.1)
+        self.assertRegex(str(cm.exception), r"^.*reply.*$")
+
+    def test_game_cannot_be_used_after_worker_does_not_reply(self):
+        self.start_stalled_worker(1)
+        distributed_game = DistributedGame(3, [self.address], self.authkey,
+            timeout=0.1)
+        with self.assertRaises(WorkerError):
+            distributed_game.get_population()
+        with self.assertRaises(WorkerError) as cm:
+            distributed_game.get_population()
+        self.assertRegex(str(cm.exception), r"^.*failure.*$")
+        self.assertTrue(self.coordinator_has_disconnected.wait(1))
+        distributed_game.close()
+
+    def test_connections_are_closed_when_connecting_to_worker_fails(self):
+        self.start_stalled_worker(0)
+        missing_address = os.path.join(self.tmp_dir, 'missing.sock')
+        with self.assertRaises(WorkerError):
+            DistributedGame(4, [self.address, missing_address],
+                self.authkey, timeout=0.1)
+        self.assertTrue(self.coordinator_has_disconnected.wait(1))
+
+    def test_timeout_does_not_apply_to_steps(self):
+        # A step of a 500x1000 strip takes well over the timeout.
+        with DistributedGame.spawn_local(1000, 2,
+                timeout=0.05) as distributed_game:
+            distributed_game.seed_random(0.3, seed=1)
+            distributed_game.make_step()
+            lattice = Lattice.random(1000, 0.3, seed=1)
+            game = Game.from_lattice(lattice, 'block')
+            game.make_step()
+            self.assertEqual(distributed_game.get_snapshot(), game._lattice)
@@ -10,6 +10,7 @@
 import unittest
 
 from life.game import Game
+from life.game import InvalidEngineError
 
 
 class GameCreationTests(unittest.TestCase):
@@ -28,6 +29,19 @@ class GameCreationTests(unittest.TestCase):
             for y in range(game.size):
                 self.assertTrue(game.is_dead(x, y))
 
+    def test_game_uses_cell_engine_by_default(self):
+        game = Game(3)
+        self.assertEqual(game.engine, 'cell')
+
+    def test_create_game_with_block_engine(self):
+        game = Game(3, engine='block')
+        self.assertEqual(game.engine, 'block')
+
+    def test_invalid_engine_error_is_raised_on_unknown_engine(self):
+        with self.assertRaises(InvalidEngineError) as cm:
+            Game(3, engine='unknown')
+        self.assertRegex(str(cm.exception), r"^.*unknown.*$")
+
     def test_create_game_from_string(self):
         game = Game.from_string(
             "xx\n"
@@ -150,6 +164,13 @@ class GameMakeStepTests(unittest.TestCase):
         )
         self.scenario_validate_make_step(game, expected_game)
 
+
+class GameBlockEngineMakeStepTests(GameMakeStepTests):
+    def scenario_validate_make_step(self, original_game, expected_game):
+        original_game = Game.from_lattice(original_game._lattice, 'block')
+        super().scenario_validate_make_step(original_game, expected_game)
+
+
 class GameDelegationTests(unittest.TestCase):
     def setUp(self):
         self.game = Game.from_string(
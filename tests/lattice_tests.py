@@ -7,9 +7,12 @@
 
 """Tests for the lattice module."""
 
+import math
 import unittest
 
+from life.lattice import InvalidDensityError
 from life.lattice import InvalidSizeError
+from life.lattice import InvalidSpacingError
 from life.lattice import InvalidSymbolError
 from life.lattice import OutOfBoundsError
 from life.lattice import Lattice
@@ -128,6 +131,115 @@ class LatticeFromStringCreationTests(unittest.TestCase):
             )
 
 
+class LatticeRandomCreationTests(unittest.TestCase):
+    def test_creation_with_size_and_get_size(self):
+        lattice = Lattice.random(5, 0.5, seed=1)
+        self.assertEqual(lattice.size, 5)
+
+    def test_lattices_with_same_seed_are_equal(self):
+        lattice1 = Lattice.random(20, 0.3, seed=42)
+        lattice2 = Lattice.random(20, 0.3, seed=42)
+        self.assertEqual(lattice1, lattice2)
+
+    def test_lattices_with_different_seeds_are_not_equal(self):
+        lattice1 = Lattice.random(20, 0.3, seed=1)
+        lattice2 = Lattice.random(20, 0.3, seed=2)
+        self.assertNotEqual(lattice1, lattice2)
+
+    def test_all_cells_are_dead_on_zero_density(self):
+        lattice = Lattice.random(4, 0, seed=1)
+        self.assertEqual(lattice, Lattice(4))
+
+    def test_all_cells_are_live_on_full_density(self):
+        lattice = Lattice.random(4, 1, seed=1)
+        for x in range(lattice.size):
+            for y in range(lattice.size):
+                self.assertTrue(lattice.is_live(x, y))
+
+    def scenario_proportion_of_live_cells_matches_density(self, size,
+            density):
+        lattice = Lattice.random(size, density, seed=1)
+        num_of_cells = size ** 2
+        num_of_live_cells = sum(lattice.is_live(x, y)
+            for x in range(size) for y in range(size))
+        # The number of live cells is binomially distributed, so allow five
+        # standard deviations of the proportion.
+        delta = 5 * math.sqrt(density * (1 - density) / num_of_cells)
+        self.assertAlmostEqual(num_of_live_cells / num_of_cells, density,
+            delta=delta)
+
+    def test_proportion_of_live_cells_matches_density(self):
+        self.scenario_proportion_of_live_cells_matches_density(200, 0.25)
+
+    def test_proportion_of_live_cells_matches_sparse_density(self):
+        # Densities below 1/512 used to be rounded to zero.
+        self.scenario_proportion_of_live_cells_matches_density(1000, 0.0019)
+
+    def test_rows_can_be_created_separately(self):
+        lattice = Lattice.random(20, 0.3, seed=5)
+        self.assertEqual(Lattice._create_random_rows(20, 0.3, 5, 7, 12),
+            lattice._lattice[7:12])
+
+    def test_invalid_size_error_is_raised_on_zero_size(self):
+        with self.assertRaises(InvalidSizeError):
+            Lattice.random(0, 0.5)
+
+    def test_invalid_density_error_is_raised_on_negative_density(self):
+        with self.assertRaises(InvalidDensityError) as cm:
+            Lattice.random(4, -0.5)
+        self.assertRegex(str(cm.exception), r"^.*-0\.5.*$")
+
+    def test_invalid_density_error_is_raised_on_density_above_one(self):
+        with self.assertRaises(InvalidDensityError):
+            Lattice.random(4, 1.5)
+
+
+class LatticeTiledCreationTests(unittest.TestCase):
+    def test_pattern_is_stamped_every_spacing_cells(self):
+        pattern = Lattice.from_string(
+            "x \n"
+            " x\n"
+        )
+        lattice = Lattice.tiled(7, pattern, 3)
+        self.assertEqual(lattice, Lattice.from_string(
+            "x  x  x\n"
+            " x  x  \n"
+            "       \n"
+            "x  x  x\n"
+            " x  x  \n"
+            "       \n"
+            "x  x  x\n"
+        ))
+
+    def test_spacing_equal_to_pattern_size_fills_lattice(self):
+        lattice = Lattice.tiled(4, Lattice.from_string("x"), 1)
+        self.assertEqual(lattice, Lattice.random(4, 1))
+
+    def test_pattern_is_not_modified(self):
+        pattern = Lattice.from_string(
+            "x \n"
+            " x\n"
+        )
+        Lattice.tiled(5, pattern, 3)
+        self.assertEqual(pattern, Lattice.from_string(
+            "x \n"
+            " x\n"
+        ))
+
+    def test_rows_of_tiled_lattice_are_independent(self):
+        lattice = Lattice.tiled(4, Lattice.from_string("x"), 2)
+        lattice.make_live(0, 1)
+        self.assertTrue(lattice.is_dead(2, 1))
+
+    def test_invalid_spacing_error_is_raised_on_too_small_spacing(self):
+        with self.assertRaises(InvalidSpacingError):
+            Lattice.tiled(5, Lattice(2), 1)
+
+    def test_invalid_size_error_is_raised_on_zero_size(self):
+        with self.assertRaises(InvalidSizeError):
+            Lattice.tiled(0, Lattice(1), 1)
+
+
 class LatticeLivenessTests(unittest.TestCase):
     def setUp(self):
         self.lattice = Lattice(4)